@@ -7,6 +7,7 @@ import logging
 
 from src.models.conversion_task import ConversionTask
 from src.models.conversion_result import ConversionResult
+from src.models.live_preview_request import LivePreviewRequest
 from src.core.file_scanner import FileScanner, ScanResult
 from src.core.converter import HEICConverter
 
@@ -47,6 +48,7 @@ class BatchJob:
     delete_source: bool = False
     preserve_exif: bool = True
     preserve_folder_structure: bool = True
+    preview_request: Optional[LivePreviewRequest] = None  # Live preview returned with results (None = off)
 
     # Results storage
     results: list[ConversionResult] = field(default_factory=list)
@@ -235,7 +237,8 @@ class BatchManager:
                 output_path=output_path,
                 quality=job.quality,
                 delete_source=job.delete_source,
-                preserve_exif=job.preserve_exif
+                preserve_exif=job.preserve_exif,
+                preview_request=job.preview_request
             )
 
     def update_job_progress(self, job: BatchJob, result: ConversionResult) -> None:
@@ -2,6 +2,7 @@ from PIL import Image
 from pillow_heif import register_heif_opener
 from pathlib import Path
 import time
+import math
 import logging
 from typing import Optional
 
@@ -63,12 +64,23 @@ class HEICConverter:
                 # Save as JPEG
                 img.save(task.output_path, **save_kwargs)
 
+                # Calculate conversion time (the preview below is not part of it)
+                conversion_time = time.time() - start_time
+
+                # Downscale the already-decoded pixels for the live preview when
+                # this result is due one. Best effort: the JPEG is already
+                # written, so a failure here must not fail the conversion.
+                preview = None
+                preview_size = task.preview_request.claim() if task.preview_request else None
+                if preview_size:
+                    try:
+                        preview = HEICConverter.create_preview(img, preview_size)
+                    except Exception as e:
+                        logger.warning(f"Could not create live preview for {task.input_filename}: {e}")
+
             # Get output file size
             file_size_after = task.output_path.stat().st_size
 
-            # Calculate conversion time
-            conversion_time = time.time() - start_time
-
             logger.info(f"Converted: {task.input_filename} → {task.output_path} "
                        f"({file_size_before / 1024:.1f}KB → {file_size_after / 1024:.1f}KB, "
                        f"{conversion_time:.2f}s)")
@@ -79,7 +91,8 @@ class HEICConverter:
                 output_path=task.output_path,
                 file_size_before=file_size_before,
                 file_size_after=file_size_after,
-                conversion_time=conversion_time
+                conversion_time=conversion_time,
+                preview=preview
             )
 
         except Exception as e:
@@ -97,6 +110,27 @@ class HEICConverter:
                 conversion_time=conversion_time
             )
 
+    @staticmethod
+    def create_preview(img: Image.Image, target_size: tuple[int, int]) -> tuple[bytes, int, int]:
+        """
+        Create a small RGB preview from an already-decoded image.
+
+        Args:
+            img: Decoded source image (RGB or L)
+            target_size: (width, height) the preview must cover once scaled
+                to fill it with the aspect ratio kept (never enlarged)
+
+        Returns:
+            Tuple of (RGB888 bytes, width, height)
+        """
+        target_width, target_height = target_size
+        scale = min(1.0, max(target_width / img.width, target_height / img.height))
+        size = (max(1, math.ceil(img.width * scale)), max(1, math.ceil(img.height * scale)))
+        preview = img.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+        if preview.mode != 'RGB':
+            preview = preview.convert('RGB')
+        return preview.tobytes('raw', 'RGB'), preview.width, preview.height
+
     @staticmethod
     def create_output_path(input_path: Path, output_dir: Optional[Path] = None) -> Path:
         """
@@ -16,6 +16,7 @@ class ConversionResult:
     file_size_after: Optional[int] = None  # bytes
     conversion_time: Optional[float] = None  # seconds
     timestamp: datetime = field(default_factory=datetime.now)
+    preview: Optional[tuple[bytes, int, int]] = field(default=None, repr=False)  # RGB888 data, width, height
 
     def __post_init__(self):
         """Ensure paths are Path objects."""
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from src.models.live_preview_request import LivePreviewRequest
+
 
 @dataclass
 class ConversionTask:
@@ -12,6 +14,7 @@ class ConversionTask:
     quality: int = 85
     delete_source: bool = False
     preserve_exif: bool = True
+    preview_request: Optional[LivePreviewRequest] = None  # Live preview to return with the result (None = no preview)
 
     def __post_init__(self):
         """Validate task parameters."""
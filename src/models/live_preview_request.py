@@ -0,0 +1,45 @@
+from typing import Optional
+import threading
+import time
+
+
+class LivePreviewRequest:
+    """
+    Live preview size shared between the preview panel and conversion workers.
+
+    The panel keeps the size in step with its live label (None when it will
+    decode the file itself). Workers call claim() after saving, and at most
+    one result per min_interval carries a preview, so only the frames the
+    panel actually shows pay for the resize.
+    """
+
+    def __init__(self, min_interval: float = 0.25):
+        self.min_interval = min_interval
+        self._size: Optional[tuple[int, int]] = None
+        self._last_claim: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def size(self) -> Optional[tuple[int, int]]:
+        """Width and height the preview must cover, or None when previews are off."""
+        return self._size
+
+    def set_size(self, size: Optional[tuple[int, int]]) -> None:
+        with self._lock:
+            self._size = size
+
+    def claim(self) -> Optional[tuple[int, int]]:
+        """
+        Claim the next preview slot.
+
+        Returns:
+            Size to render the preview at, or None if this result should skip it
+        """
+        with self._lock:
+            if self._size is None:
+                return None
+            now = time.monotonic()
+            if self._last_claim is not None and now - self._last_claim < self.min_interval:
+                return None
+            self._last_claim = now
+            return self._size
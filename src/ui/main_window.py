@@ -3,7 +3,7 @@ from PyQt6.QtWidgets import (
     QPushButton, QLabel, QMessageBox, QProgressDialog, QToolButton
 )
 from PyQt6.QtCore import Qt, pyqtSignal, QThread, QTimer
-from PyQt6.QtGui import QCloseEvent, QIcon
+from PyQt6.QtGui import QCloseEvent, QIcon, QImage
 from pathlib import Path
 from typing import Optional
 import logging
@@ -19,6 +19,7 @@ from src.ui.widgets.queue_panel import QueuePanel
 from src.ui.widgets.preview_panel import PreviewPanel
 from src.ui.widgets.matrix_rain import MatrixRainWidget, ScanlineOverlay
 from src.utils import win_context_menu
+from src.utils.logger import LoggerSetup, DEFAULT_LOG_DIR
 
 logger = logging.getLogger(__name__)
 
@@ -574,6 +575,7 @@ class MainWindow(QMainWindow):
             job.preserve_exif = self.settings.preserve_exif
             job.output_dir = output_dir
             job.preserve_folder_structure = self.settings.preserve_folder_structure
+            job.preview_request = self.preview_panel.live_preview_request
             logger.info(
                 "Applied settings to job %s | output_dir: %s | preserve_structure: %s",
                 job.id,
@@ -648,7 +650,13 @@ class MainWindow(QMainWindow):
 
         # Add successfully converted file to live preview
         if result.success and result.output_path:
-            self.preview_panel.add_conversion(result.output_path)
+            preview_image = None
+            if result.preview:
+                data, width, height = result.preview
+                preview_image = QImage(data, width, height, width * 3, QImage.Format.Format_RGB888)
+                # Results are kept for the session log; don't retain preview pixels
+                result.preview = None
+            self.preview_panel.add_conversion(result.output_path, preview_image)
 
     def on_job_started(self, job: BatchJob):
         """Handle job start."""
@@ -662,6 +670,8 @@ class MainWindow(QMainWindow):
         """Handle job completion."""
         logger.info(f"Job completed: {job.id}")
         self.queue_panel.set_job_completed(job.id)
+        # Also covers stopped jobs, which never reach their last result
+        self.progress_panel.finish_batch()
 
     def on_all_completed(self):
         """Handle all jobs completion."""
@@ -716,12 +726,14 @@ class MainWindow(QMainWindow):
 
     def view_logs(self):
         """Open logs directory."""
-        from pathlib import Path
         import os
         import subprocess
 
-        log_dir = Path(__file__).parent.parent.parent / "logs"
-        log_dir.mkdir(parents=True, exist_ok=True)
+        # LoggerSetup.setup() already resolved and created the directory
+        log_dir = LoggerSetup.log_dir
+        if log_dir is None:
+            log_dir = DEFAULT_LOG_DIR
+            log_dir.mkdir(parents=True, exist_ok=True)
 
         # Open in file explorer
         if os.name == 'nt':  # Windows
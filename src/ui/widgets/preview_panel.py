@@ -2,20 +2,215 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QScrollArea, QGroupBox, QPushButton, QStackedWidget, QToolButton, QFileDialog, QSizePolicy, QSlider
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QThread, QSize, QTimer, QElapsedTimer
+from PyQt6.QtCore import Qt, pyqtSignal, QObject, QRunnable, QThread, QThreadPool, QSize, QTimer
 from PyQt6.QtGui import QPixmap, QImage, QDragEnterEvent, QDropEvent, QIcon
 from pathlib import Path
+from collections import OrderedDict
+from functools import lru_cache
 from PIL import Image
-from pillow_heif import register_heif_opener
+from pillow_heif import register_heif_opener, open_heif, thumbnail as heif_thumbnail
 import logging
+import os
 
 from src.ui.widgets.drop_zone import DropZoneWidget
+from src.models.live_preview_request import LivePreviewRequest
+
+try:
+    from turbojpeg import TurboJPEG, TJPF_RGB
+    _turbo_jpeg = TurboJPEG()
+except (ImportError, OSError, RuntimeError):  # PyTurboJPEG or libjpeg-turbo not available
+    _turbo_jpeg = None
 
 # Register HEIF opener
 register_heif_opener()
 
 logger = logging.getLogger(__name__)
 
+ICON_DIR = Path(__file__).resolve().parent.parent.parent.parent / "resources" / "icons"
+
+JPEG_MAGIC = b'\xff\xd8\xff'
+HEIF_SUFFIXES = {'.heic', '.heif'}
+# Box-reduce down to 2x the target before LANCZOS (fewer filter taps on large images)
+RESIZE_REDUCING_GAP = 2.0
+# Decode pool priorities: navigation/scrub beats live updates
+NAV_PRIORITY = 10
+LIVE_PRIORITY = 5
+PREFETCH_PRIORITY = 1
+# Token for neighbor prefetches: results only warm the gallery cache
+PREFETCH_TOKEN = -1
+PREFETCH_OFFSETS = (1, -1, 2, -2, 3, -3)
+# Edge length of low-res gallery frames decoded while scrubbing
+GALLERY_LOW_RES_DIM = 512
+# Minimum seconds between results that carry a converter-made live preview
+LIVE_PREVIEW_INTERVAL = 0.25
+
+
+# Pillow mode -> (raw pack mode, bytes per pixel, QImage format)
+QIMAGE_FORMATS = {
+    'RGB': ('RGBX', 4, QImage.Format.Format_RGBX8888),
+    'RGBA': ('RGBA', 4, QImage.Format.Format_RGBA8888),
+    'L': ('L', 1, QImage.Format.Format_Grayscale8),
+}
+
+# pillow_heif mode -> QImage format its decoded buffer can be wrapped in as-is
+HEIF_QIMAGE_FORMATS = {
+    'RGB': QImage.Format.Format_RGB888,
+    'RGBA': QImage.Format.Format_RGBA8888,
+    'L': QImage.Format.Format_Grayscale8,
+}
+
+
+def _to_qimage(img: Image.Image) -> QImage:
+    """
+    Wrap a Pillow image in a QImage with a single buffer copy.
+
+    Modes QImage can consume natively are packed as-is (Pillow keeps RGB
+    pixels 4 bytes wide, so RGBX is a plain per-line copy); anything else is
+    converted first. QImage references the bytes object without copying it again.
+    """
+    if img.mode not in QIMAGE_FORMATS:
+        img = _to_native_mode(img)
+    raw_mode, bytes_per_pixel, fmt = QIMAGE_FORMATS[img.mode]
+    data = img.tobytes('raw', raw_mode)
+    return QImage(data, img.width, img.height, img.width * bytes_per_pixel, fmt)
+
+
+def _to_native_mode(img: Image.Image) -> Image.Image:
+    """Convert an image QImage can't consume directly, keeping alpha if present."""
+    return img.convert('RGBA' if img.has_transparency_data else 'RGB')
+
+
+@lru_cache(maxsize=None)
+def _icon(name: str) -> QIcon:
+    """Shared QIcon from resources/icons, loaded on first use (needs a QApplication)."""
+    return QIcon(str(ICON_DIR / name))
+
+
+def _is_jpeg(file_path: Path) -> bool:
+    with open(file_path, 'rb') as f:
+        return f.read(3) == JPEG_MAGIC
+
+
+def _decode_jpeg_scaled(file_path: Path, max_dim=None, is_cancelled=None):
+    """Decode a JPEG with libjpeg-turbo, scaling down during the IDCT where possible."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    scaling_factor = (1, 1)
+    if max_dim:
+        width, height, _, _ = _turbo_jpeg.decode_header(data)
+        longest = max(width, height)
+        # Smallest downscaling DCT factor that still covers max_dim; LANCZOS
+        # finishes the rest. Factors above 1 would only decode extra pixels.
+        reducing = [factor for factor in _turbo_jpeg.scaling_factors if factor[0] <= factor[1]]
+        for num, den in sorted(reducing, key=lambda factor: factor[0] / factor[1]):
+            if longest * num / den >= max_dim:
+                scaling_factor = (num, den)
+                break
+    if is_cancelled and is_cancelled():
+        return None
+    pixels = _turbo_jpeg.decode(data, pixel_format=TJPF_RGB, scaling_factor=scaling_factor)
+    height, width = pixels.shape[:2]
+    if not max_dim or max(width, height) <= max_dim:
+        return QImage(pixels.data, width, height, pixels.strides[0], QImage.Format.Format_RGB888)
+    img = Image.frombuffer('RGB', (width, height), pixels, 'raw', 'RGB', pixels.strides[0], 1)
+    img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    return _to_qimage(img)
+
+
+def _decode_heif_scaled(file_path: Path, max_dim=None, is_cancelled=None):
+    """Decode a HEIF from pillow_heif's own buffer, bypassing the Pillow plugin."""
+    heif_file = open_heif(file_path, convert_hdr_to_8bit=True)
+    # Prefer an embedded thumbnail when it covers max_dim
+    heif_image = heif_thumbnail(heif_file, min_box=max_dim) if max_dim else heif_file
+    if is_cancelled and is_cancelled():
+        return None
+    width, height = heif_image.size
+    fits = not max_dim or max(width, height) <= max_dim
+    if fits and heif_image.mode in HEIF_QIMAGE_FORMATS:
+        return QImage(heif_image.data, width, height, heif_image.stride, HEIF_QIMAGE_FORMATS[heif_image.mode])
+    # Downscale, or let _to_qimage convert modes QImage can't wrap directly
+    img = Image.frombuffer(heif_image.mode, heif_image.size, heif_image.data, 'raw', heif_image.mode, heif_image.stride, 1)
+    if not fits:
+        img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+    return _to_qimage(img)
+
+
+def _decode_scaled(file_path: Path, max_dim=None, is_cancelled=None):
+    """
+    Decode an image file into a QImage no larger than max_dim.
+
+    Args:
+        file_path: Image to decode
+        max_dim: Maximum width/height (None = full resolution)
+        is_cancelled: Optional callable polled before the pixel decode starts
+
+    Returns:
+        QImage, or None if cancelled
+    """
+    if _turbo_jpeg is not None and _is_jpeg(file_path):
+        return _decode_jpeg_scaled(file_path, max_dim, is_cancelled)
+    if file_path.suffix.lower() in HEIF_SUFFIXES:
+        return _decode_heif_scaled(file_path, max_dim, is_cancelled)
+    with Image.open(file_path) as img:
+        # Opening only reads the header; bail before the expensive decode
+        if is_cancelled and is_cancelled():
+            return None
+        if max_dim:
+            if img.format == 'HEIF':
+                # Prefer an embedded HEIF thumbnail when it covers max_dim
+                img = heif_thumbnail(img, min_box=max_dim)
+            elif img.format == 'JPEG':
+                # Let libjpeg scale by 1/2..1/8 in the DCT domain, before any mode convert
+                draft_dim = int(max_dim * RESIZE_REDUCING_GAP)
+                img.draft('RGB', (draft_dim, draft_dim))
+        if img.mode not in QIMAGE_FORMATS:
+            img = _to_native_mode(img)
+        if max_dim:
+            img.thumbnail((max_dim, max_dim), Image.Resampling.LANCZOS, reducing_gap=RESIZE_REDUCING_GAP)
+        return _to_qimage(img)
+
+
+def _source_pixmap(image: QImage) -> QPixmap:
+    """Pixmap used only as a scaling source; skip converting it to the display format."""
+    return QPixmap.fromImage(image, Qt.ImageConversionFlag.NoFormatConversion)
+
+
+def _scaled_key(pixmap: QPixmap, label: QLabel, fast: bool) -> tuple:
+    """Identity of a label-sized render of pixmap."""
+    return (pixmap.cacheKey(), label.width(), label.height(), fast)
+
+
+def _scale_mode(fast: bool) -> Qt.TransformationMode:
+    if fast:
+        return Qt.TransformationMode.FastTransformation
+    return Qt.TransformationMode.SmoothTransformation
+
+
+class PixmapCache:
+    """Small LRU of decoded gallery pixmaps keyed by (file_path, max_dim)."""
+
+    def __init__(self, maxsize: int = 64):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+
+    def get(self, key):
+        pixmap = self._items.get(key)
+        if pixmap is not None:
+            self._items.move_to_end(key)
+        return pixmap
+
+    def put(self, key, pixmap: QPixmap):
+        self._items[key] = pixmap
+        self._items.move_to_end(key)
+        while len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def __contains__(self, key):
+        return key in self._items
+
+    def clear(self):
+        self._items.clear()
+
 
 class ThumbnailWidget(QWidget):
     """Widget for displaying a single image thumbnail."""
@@ -83,27 +278,11 @@ class ThumbnailWidget(QWidget):
     def load_thumbnail(self):
         """Load and display thumbnail."""
         try:
-            # Open image and create thumbnail
-            with Image.open(self.file_path) as img:
-                # Convert to RGB if needed
-                if img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-
-                # Create thumbnail
-                img.thumbnail((self.thumbnail_size, self.thumbnail_size), Image.Resampling.LANCZOS)
-
-                # Convert to QPixmap
-                img_data = img.tobytes('raw', 'RGB')
-                qimage = QImage(
-                    img_data,
-                    img.width,
-                    img.height,
-                    img.width * 3,
-                    QImage.Format.Format_RGB888
-                )
-                pixmap = QPixmap.fromImage(qimage)
-
-                self.image_label.setPixmap(pixmap)
+            # Decode a thumbnail-sized image and convert to QPixmap
+            qimage = _decode_scaled(self.file_path, self.thumbnail_size)
+            pixmap = QPixmap.fromImage(qimage)
+
+            self.image_label.setPixmap(pixmap)
 
         except Exception as e:
             logger.warning(f"Could not load thumbnail for {self.file_path}: {e}")
@@ -126,113 +305,86 @@ class ThumbnailWidget(QWidget):
 class ThumbnailLoader(QThread):
     """Background loader for thumbnails to keep UI responsive."""
 
-    thumbnail_ready = pyqtSignal(object, object)  # file_path, QPixmap
+    thumbnail_ready = pyqtSignal(object, object)  # file_path, QImage
 
     def __init__(self, files: list[Path], size: int):
         super().__init__()
         self.files = files
         self.size = size
-        self._stopped = False
 
     def stop(self):
-        self._stopped = True
+        self.requestInterruption()
 
     def run(self):
         for file_path in self.files:
-            if self._stopped:
+            if self.isInterruptionRequested():
                 break
             try:
-                with Image.open(file_path) as img:
-                    if img.mode not in ('RGB', 'L'):
-                        img = img.convert('RGB')
-                    img.thumbnail((self.size, self.size), Image.Resampling.LANCZOS)
-                    img_data = img.tobytes('raw', 'RGB')
-                    qimage = QImage(
-                        img_data,
-                        img.width,
-                        img.height,
-                        img.width * 3,
-                        QImage.Format.Format_RGB888
-                    )
-                    pixmap = QPixmap.fromImage(qimage)
-                    self.thumbnail_ready.emit(file_path, pixmap)
+                qimage = _decode_scaled(file_path, self.size, self.isInterruptionRequested)
+                if qimage is None:
+                    break
+                self.thumbnail_ready.emit(file_path, qimage)
             except Exception as e:
                 logger.warning(f"Could not load thumbnail for {file_path}: {e}")
 
 
-class LiveImageLoader(QThread):
-    """Background loader for the latest converted image."""
+class DecodeSignals(QObject):
+    """
+    Signal sink that marshals pooled decode results back to the GUI thread.
 
-    image_ready = pyqtSignal(object, object, bool)  # file_path, QPixmap, is_low_res
-
-    def __init__(self, file_path: Path, max_dim=None):
-        super().__init__()
-        self.file_path = file_path
-        self.max_dim = max_dim
-
-    def run(self):
-        try:
-            with Image.open(self.file_path) as img:
-                if img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-                if self.max_dim:
-                    img.thumbnail((self.max_dim, self.max_dim), Image.Resampling.LANCZOS)
-                img_data = img.tobytes('raw', 'RGB')
-                qimage = QImage(
-                    img_data,
-                    img.width,
-                    img.height,
-                    img.width * 3,
-                    QImage.Format.Format_RGB888
-                )
-                pixmap = QPixmap.fromImage(qimage)
-                self.image_ready.emit(self.file_path, pixmap, self.max_dim is not None)
-        except Exception as e:
-            logger.warning(f"Could not load live preview for {self.file_path}: {e}")
+    Workers only build QImages; QPixmap conversion happens in the slots. The
+    QImage is sent as a Python object (not by value) so the buffer it wraps
+    stays referenced until the GUI thread is done with it.
+    """
 
+    image_ready = pyqtSignal(object, object, int, bool)  # file_path, QImage, token, is_low_res
+    error_ready = pyqtSignal(object, str, int)  # file_path, error message, token
 
-class GalleryImageLoader(QThread):
-    """Background loader for gallery preview images."""
 
-    image_ready = pyqtSignal(object, object, int, bool)  # file_path, QPixmap, token, is_low_res
-    error_ready = pyqtSignal(object, str, int)  # file_path, error message, token
+class DecodeJob(QRunnable):
+    """Pooled decode of a single preview image (gallery or live)."""
 
-    def __init__(self, file_path: Path, token: int, max_dim=None):
+    def __init__(self, file_path: Path, token: int, max_dim, signals: DecodeSignals):
         super().__init__()
         self.file_path = file_path
         self.token = token
         self.max_dim = max_dim
+        self.signals = signals
+        self.cancelled = False
+
+    def cancel(self):
+        """Skip the decode if it has not started yet; nothing is emitted."""
+        self.cancelled = True
 
     def run(self):
         try:
-            with Image.open(self.file_path) as img:
-                if img.mode not in ('RGB', 'L'):
-                    img = img.convert('RGB')
-                if self.max_dim:
-                    img.thumbnail((self.max_dim, self.max_dim), Image.Resampling.LANCZOS)
-                img_data = img.tobytes('raw', 'RGB')
-                qimage = QImage(
-                    img_data,
-                    img.width,
-                    img.height,
-                    img.width * 3,
-                    QImage.Format.Format_RGB888
-                )
-                pixmap = QPixmap.fromImage(qimage)
-                self.image_ready.emit(self.file_path, pixmap, self.token, self.max_dim is not None)
+            qimage = _decode_scaled(self.file_path, self.max_dim, lambda: self.cancelled)
+            if qimage is None:
+                return
+            self.signals.image_ready.emit(self.file_path, qimage, self.token, self.max_dim is not None)
         except Exception as e:
-            self.error_ready.emit(self.file_path, str(e), self.token)
+            self.signals.error_ready.emit(self.file_path, str(e), self.token)
 
 
 class LiveImageLabel(QLabel):
     """Label that doesn't request size based on pixmap dimensions."""
 
+    geometry_changed = pyqtSignal()  # shown or resized
+
     def sizeHint(self):
         return QSize(0, 0)
 
     def minimumSizeHint(self):
         return QSize(0, 0)
 
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.geometry_changed.emit()
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.geometry_changed.emit()
+
 
 class PreviewPanel(QWidget):
     """Panel for previewing images that will be converted."""
@@ -248,24 +400,51 @@ class PreviewPanel(QWidget):
         self.live_mode = False
         self.hide_preview = False
         self.thumbnail_loader = None
-        self.live_loader = None
+        self.live_job_active = False
+        self._live_job = None
         self.pending_live_path = None
         self.live_request_token = 0
         self.latest_live_token = 0
-        self.gallery_loader = None
         self.current_index = 0
         self.current_gallery_pixmap = None
+        # Only low-res frames are cached: 64 x 512^2 x 4 B keeps it around 64 MB
+        self.gallery_cache = PixmapCache(maxsize=64)
+        # Label-sized renders of source pixmaps; flushed whenever the label is resized
+        self.gallery_scaled_cache = PixmapCache(maxsize=16)
+        self._prefetch_pending = set()
+        self._live_original_pixmap = None
+        self._last_live_scaled_key = None
+        self._last_gallery_scaled_key = None
+        # Whether a scaled preview is currently set on each label; lets
+        # resizeEvent skip idle labels without querying their pixmaps
+        self._has_live_pixmap = False
+        self._has_gallery_pixmap = False
         self.failed_gallery = set()
-        self._stale_loaders = []
+        self._stale_loaders = set()
         self.pending_index = None
-        self.last_gallery_load = QElapsedTimer()
         self.gallery_request_token = 0
         self.latest_request_token = 0
+        self._gallery_job = None
         self.scrubbing = False
         self.scrub_timer = QTimer()
         self.scrub_timer.setInterval(60)
         self.scrub_timer.setSingleShot(True)
         self.scrub_timer.timeout.connect(self._on_scrub_timer)
+        self.resize_timer = QTimer()
+        self.resize_timer.setInterval(120)
+        self.resize_timer.setSingleShot(True)
+        self.resize_timer.timeout.connect(self._rescale_previews)
+        # Shared pool for gallery/live decodes; stale results are dropped by token
+        self.decode_pool = QThreadPool(self)
+        self.decode_pool.setMaxThreadCount(min(4, os.cpu_count() or 1))
+        self.gallery_signals = DecodeSignals(self)
+        self.gallery_signals.image_ready.connect(self._set_gallery_image)
+        self.gallery_signals.error_ready.connect(self._on_gallery_error)
+        self.live_signals = DecodeSignals(self)
+        self.live_signals.image_ready.connect(self._set_live_image)
+        self.live_signals.error_ready.connect(self._on_live_error)
+        # Converter-side previews, sized to the live label while it is on screen
+        self.live_preview_request = LivePreviewRequest(LIVE_PREVIEW_INTERVAL)
         self.init_ui()
 
     def init_ui(self):
@@ -297,7 +476,7 @@ class PreviewPanel(QWidget):
 
         self.add_folder_button = QToolButton()
         self.add_folder_button.setText("Add Folder")
-        self.add_folder_button.setIcon(QIcon(str(Path(__file__).parent.parent.parent.parent / "resources" / "icons" / "folder_add.svg")))
+        self.add_folder_button.setIcon(_icon("folder_add.svg"))
         self.add_folder_button.setObjectName("icon_tool")
         self.add_folder_button.setToolTip("Add another folder to the batch queue")
         self.add_folder_button.clicked.connect(self._browse_for_folder)
@@ -393,6 +572,7 @@ class PreviewPanel(QWidget):
         self.live_image_label.setStyleSheet("color: #7DE8A6; font-size: 10pt;")
         self.live_image_label.setMinimumHeight(150)
         self.live_image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self.live_image_label.geometry_changed.connect(self._update_live_preview_request)
         live_layout.addWidget(self.live_image_label)
 
         self.preview_stack.addWidget(thumbnails_view)
@@ -458,6 +638,7 @@ class PreviewPanel(QWidget):
             self.clear_button.setVisible(False)
             self.gallery_label.setText("No preview loaded")
             self.current_gallery_pixmap = None
+            self._has_gallery_pixmap = False
             self.index_label.setText("0 / 0")
             self.prev_button.setEnabled(False)
             self.next_button.setEnabled(False)
@@ -497,73 +678,126 @@ class PreviewPanel(QWidget):
         self.preview_stack.setCurrentIndex(1)
         self._stop_thumbnail_loader()
         self.clear_thumbnails()
+        self._live_original_pixmap = None
+        self._has_live_pixmap = False
         if self.hide_preview:
             self.live_image_label.setText("Preview hidden")
             self.live_image_label.setPixmap(QPixmap())
         else:
             self.live_image_label.setText("Waiting for first conversion...")
             self.live_image_label.setPixmap(QPixmap())
+        self._update_live_preview_request()
 
     def disable_live_mode(self):
         """Disable live preview mode."""
         self.live_mode = False
-        if self.live_loader and self.live_loader.isRunning():
-            self._stale_loaders.append(self.live_loader)
-        self.live_loader = None
+        self.live_preview_request.set_size(None)
         self.pending_live_path = None
         self.latest_live_token = 0
-        if self.gallery_loader and self.gallery_loader.isRunning():
-            self._stale_loaders.append(self.gallery_loader)
-        self.gallery_loader = None
+        self._cancel_live_job()
         self.info_label.setText("Preview of images to convert")
         self.info_label.setStyleSheet("color: #7DE8A6; font-size: 9pt;")
         self.preview_stack.setCurrentIndex(0)
 
-    def add_conversion(self, file_path: Path):
-        """Add a converted file to the live preview."""
+    def add_conversion(self, file_path: Path, image: QImage = None):
+        """Add a converted file to the live preview.
+
+        If the conversion pipeline already produced a decoded preview image
+        that covers the label, it is shown directly instead of re-opening the
+        written file. Results in between the converter's throttled previews
+        are skipped once something is on screen.
+        """
         if self.live_mode:
             if self.hide_preview:
                 return
+            if image is not None and not image.isNull() and self._covers_live_label(image):
+                self.pending_live_path = None
+                self.latest_live_token = 0  # Supersede any in-flight decode
+                self._cancel_live_job()
+                self._show_live_image(image)
+                return
+            if image is None and self._has_live_pixmap and self.live_preview_request.size is not None:
+                return
             self.pending_live_path = file_path
-            if not self.live_loader or not self.live_loader.isRunning():
+            if not self.live_job_active:
                 self._start_live_loader()
 
     def update_live_preview(self):
         """Deprecated: live preview now shows only the latest image."""
         return
 
+    def live_preview_size(self):
+        """Size a converter-made preview must cover, or None when the panel decodes files itself."""
+        label = self.live_image_label
+        if not self.live_mode or self.hide_preview or not label.isVisible():
+            return None
+        return (label.width(), label.height())
+
+    def _update_live_preview_request(self):
+        self.live_preview_request.set_size(self.live_preview_size())
+
+    def _covers_live_label(self, image: QImage) -> bool:
+        # KeepAspectRatioByExpanding scales by the larger ratio; it must not enlarge
+        label = self.live_image_label
+        return image.width() >= label.width() and image.height() >= label.height()
+
+    def _live_max_dim(self) -> int:
+        max_dim = max(self.live_image_label.width(), self.live_image_label.height(), 0)
+        if max_dim < 1:
+            max_dim = 1024
+        return max_dim
+
     def _start_live_loader(self):
         if not self.pending_live_path:
             return
         file_path = self.pending_live_path
         self.pending_live_path = None
-        if self.live_loader and self.live_loader.isRunning():
-            self._stale_loaders.append(self.live_loader)
         self.live_request_token += 1
         self.latest_live_token = self.live_request_token
-        max_dim = max(self.live_image_label.width(), self.live_image_label.height(), 0)
-        if max_dim < 1:
-            max_dim = 1024
-        self.live_loader = LiveImageLoader(file_path, max_dim=max_dim)
-        self.live_loader.finished.connect(lambda loader=self.live_loader: self._cleanup_loader(loader))
-        self.live_loader.image_ready.connect(self._set_live_image)
-        self.live_loader.start()
+        self.live_job_active = True
+        self._live_job = DecodeJob(file_path, self.live_request_token, self._live_max_dim(), self.live_signals)
+        self.decode_pool.start(self._live_job, LIVE_PRIORITY)
+
+    def _cancel_live_job(self):
+        if self._live_job:
+            self._live_job.cancel()
+            self._live_job = None
+        self.live_job_active = False
+
+    def _set_live_image(self, file_path: Path, image: QImage, token: int, is_low_res: bool):
+        if token == self.live_request_token:
+            self.live_job_active = False
+            self._live_job = None
+        if token == self.latest_live_token:
+            self._show_live_image(image)
+        if self.pending_live_path and not self.live_job_active:
+            self._start_live_loader()
 
-    def _set_live_image(self, file_path: Path, pixmap: QPixmap, is_low_res: bool):
-        if self.live_request_token != self.latest_live_token:
-            return
-        if pixmap.isNull():
+    def _on_live_error(self, file_path: Path, message: str, token: int):
+        if token == self.live_request_token:
+            self.live_job_active = False
+            self._live_job = None
+        logger.warning(f"Could not load live preview for {file_path}: {message}")
+        if self.pending_live_path and not self.live_job_active:
+            self._start_live_loader()
+
+    def _show_live_image(self, image: QImage):
+        if image.isNull():
             self.live_image_label.setText("Live preview unavailable")
             return
-        scaled = pixmap.scaled(
+        self._live_original_pixmap = _source_pixmap(image)
+        self._show_live_pixmap()
+        self.live_image_label.setText("")
+
+    def _show_live_pixmap(self, fast: bool = False):
+        scaled = self._live_original_pixmap.scaled(
             self.live_image_label.size(),
             Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation
+            _scale_mode(fast)
         )
         self.live_image_label.setPixmap(scaled)
-        self.live_image_label.setText("")
-        if self.pending_live_path:
-            self._start_live_loader()
+        self._has_live_pixmap = True
+        self._last_live_scaled_key = _scaled_key(self._live_original_pixmap, self.live_image_label, fast)
 
     def reset(self):
         """Reset the panel to its initial state (drop zone)."""
@@ -581,8 +815,11 @@ class PreviewPanel(QWidget):
         """Toggle preview visibility."""
         self.hide_preview = not self.hide_preview
         self.hide_button.setText("Show" if self.hide_preview else "Hide")
+        self._update_live_preview_request()
         if self.hide_preview:
             self._show_hidden_placeholder()
+            self._live_original_pixmap = None
+            self._has_live_pixmap = False
             self.live_image_label.setText("Preview hidden")
             self.live_image_label.setPixmap(QPixmap())
         else:
@@ -590,11 +827,9 @@ class PreviewPanel(QWidget):
             self.gallery_label.setVisible(True)
             if self.live_mode:
                 self.preview_stack.setCurrentIndex(1)
-                if self.live_image_label.pixmap() and not self.live_image_label.pixmap().isNull():
-                    pass
-                else:
+                if not self._live_original_pixmap:
                     self.live_image_label.setText("Waiting for first conversion...")
-                if self.pending_live_path and (not self.live_loader or not self.live_loader.isRunning()):
+                if self.pending_live_path and not self.live_job_active:
                     self._start_live_loader()
             elif self.files:
                 self.set_files(self.files)
@@ -603,6 +838,7 @@ class PreviewPanel(QWidget):
         self.gallery_label.setVisible(False)
         self.hidden_placeholder.setVisible(True)
         self.current_gallery_pixmap = None
+        self._has_gallery_pixmap = False
         self.prev_button.setEnabled(False)
         self.next_button.setEnabled(False)
         self.scrub_slider.setEnabled(False)
@@ -621,47 +857,102 @@ class PreviewPanel(QWidget):
             self.gallery_label.setText("Preview unavailable")
             self.gallery_label.setPixmap(QPixmap())
             self.current_gallery_pixmap = None
+            self._has_gallery_pixmap = False
             self._advance_to_next_available()
             return
         if self.pending_index == self.current_index:
             self.pending_index = None
-        if not self.last_gallery_load.isValid():
-            self.last_gallery_load.start()
-        else:
-            self.last_gallery_load.restart()
-        if self.gallery_loader and self.gallery_loader.isRunning():
-            self._stale_loaders.append(self.gallery_loader)
         self.gallery_request_token += 1
         self.latest_request_token = self.gallery_request_token
-        max_dim = None if full_res else 512
-        self.gallery_loader = GalleryImageLoader(file_path, self.latest_request_token, max_dim)
-        self.gallery_loader.image_ready.connect(self._set_gallery_image)
-        self.gallery_loader.error_ready.connect(self._on_gallery_error)
-        self.gallery_loader.start()
-
-    def _set_gallery_image(self, file_path: Path, pixmap: QPixmap, token: int, is_low_res: bool):
+        self._cancel_gallery_job()
+        max_dim = None if full_res else GALLERY_LOW_RES_DIM
+        cached = self.gallery_cache.get((file_path, max_dim or 0))
+        if cached is not None:
+            self._show_gallery_pixmap(cached)
+            if not self.scrubbing:
+                self._prefetch_neighbors()
+            return
+        if full_res:
+            # Show the cached low-res frame while the full image decodes
+            placeholder = self.gallery_cache.get((file_path, GALLERY_LOW_RES_DIM))
+            if placeholder is not None:
+                self._show_gallery_pixmap(placeholder)
+        self._gallery_job = DecodeJob(file_path, self.latest_request_token, max_dim, self.gallery_signals)
+        self.decode_pool.start(self._gallery_job, NAV_PRIORITY)
+
+    def _cancel_gallery_job(self):
+        # Superseded decodes bail out before the pixel decode instead of running to the token check
+        if self._gallery_job:
+            self._gallery_job.cancel()
+            self._gallery_job = None
+
+    def _set_gallery_image(self, file_path: Path, image: QImage, token: int, is_low_res: bool):
+        if token == PREFETCH_TOKEN:
+            self._prefetch_pending.discard(file_path)
+            if not image.isNull():
+                self.gallery_cache.put((file_path, GALLERY_LOW_RES_DIM), _source_pixmap(image))
+            return
         if token != self.latest_request_token:
             return
         if self.hide_preview:
             return
         if file_path in self.failed_gallery:
             return
-        if pixmap.isNull():
+        if image.isNull():
             self.gallery_label.setText("Preview unavailable")
             return
-        scaled = pixmap.scaled(
-            self.gallery_label.size(),
-            Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-            Qt.TransformationMode.SmoothTransformation
-        )
-        self.current_gallery_pixmap = scaled
-        self.gallery_label.setPixmap(scaled)
+        pixmap = _source_pixmap(image)
+        if is_low_res:
+            self.gallery_cache.put((file_path, GALLERY_LOW_RES_DIM), pixmap)
+        self._show_gallery_pixmap(pixmap)
         if self.pending_index is not None and self.pending_index != self.current_index:
             self.current_index = self.pending_index
             self.pending_index = None
             self._load_gallery_index(full_res=True)
+        elif not self.scrubbing:
+            self._prefetch_neighbors()
+
+    def _prefetch_neighbors(self):
+        """Warm the gallery cache with low-res frames around the current index."""
+        if not self.files or self.hide_preview:
+            return
+        for offset in PREFETCH_OFFSETS:
+            # Never queue more prefetches than the pool can run at once
+            if len(self._prefetch_pending) >= self.decode_pool.maxThreadCount():
+                return
+            index = (self.current_index + offset) % len(self.files)
+            if index == self.current_index:
+                continue
+            file_path = self.files[index]
+            if (file_path in self._prefetch_pending or file_path in self.failed_gallery
+                    or (file_path, GALLERY_LOW_RES_DIM) in self.gallery_cache):
+                continue
+            self._prefetch_pending.add(file_path)
+            job = DecodeJob(file_path, PREFETCH_TOKEN, GALLERY_LOW_RES_DIM, self.gallery_signals)
+            self.decode_pool.start(job, PREFETCH_PRIORITY)
+
+    def _show_gallery_pixmap(self, pixmap: QPixmap, fast: bool = None):
+        # Nearest-neighbor is fine for frames that are on screen only mid-scrub
+        if fast is None:
+            fast = self.scrubbing
+        key = _scaled_key(pixmap, self.gallery_label, fast)
+        scaled = self.gallery_scaled_cache.get(key)
+        if scaled is None:
+            scaled = pixmap.scaled(
+                self.gallery_label.size(),
+                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
+                _scale_mode(fast)
+            )
+            self.gallery_scaled_cache.put(key, scaled)
+        self.current_gallery_pixmap = pixmap
+        self.gallery_label.setPixmap(scaled)
+        self._has_gallery_pixmap = True
+        self._last_gallery_scaled_key = key
 
     def _on_gallery_error(self, file_path: Path, message: str, token: int):
+        if token == PREFETCH_TOKEN:
+            self._prefetch_pending.discard(file_path)
+            return
         if token != self.latest_request_token:
             return
         if self.hide_preview:
@@ -671,6 +962,7 @@ class PreviewPanel(QWidget):
         self.failed_gallery.add(file_path)
         logger.warning(f"Could not load gallery preview for {file_path}: {message}")
         self.current_gallery_pixmap = None
+        self._has_gallery_pixmap = False
         self.gallery_label.setPixmap(QPixmap())
         self.gallery_label.setText("Preview unavailable")
         if self.files:
@@ -718,17 +1010,10 @@ class PreviewPanel(QWidget):
             return
         self.current_index = value
         self.index_label.setText(f"{self.current_index + 1} / {len(self.files):,}")
-        if not self.last_gallery_load.isValid():
-            self.last_gallery_load.start()
-            self.pending_index = None
-            self._load_gallery_index(full_res=not self.scrubbing)
-            return
-        if self.last_gallery_load.elapsed() >= 60:
-            self.pending_index = None
-            self._load_gallery_index(full_res=not self.scrubbing)
-            return
-        self.pending_index = self.current_index
-        self.scrub_timer.start()
+        self.pending_index = value
+        # Throttle decodes to one per scrub_timer interval while the slider moves
+        if not self.scrub_timer.isActive():
+            self.scrub_timer.start()
 
     def _on_scrub_pressed(self):
         if not self.files or self.hide_preview:
@@ -742,6 +1027,7 @@ class PreviewPanel(QWidget):
         self.scrub_timer.stop()
         self.pending_index = None
         self._load_gallery_index(full_res=True)
+        self._prefetch_neighbors()
 
     def _on_scrub_timer(self):
         if not self.files or self.hide_preview:
@@ -755,13 +1041,13 @@ class PreviewPanel(QWidget):
         """Stop background loaders before app exit."""
         self.disable_live_mode()
         self._stop_thumbnail_loader()
-        if self.live_loader and self.live_loader.isRunning():
-            self._stale_loaders.append(self.live_loader)
-        self.live_loader = None
         self.pending_live_path = None
-        if self.gallery_loader and self.gallery_loader.isRunning():
-            self._stale_loaders.append(self.gallery_loader)
-        self.gallery_loader = None
+        self._cancel_gallery_job()
+        # Drop queued decodes; running ones finish and are ignored by token
+        self.decode_pool.clear()
+        self._prefetch_pending.clear()
+        self.gallery_cache.clear()
+        self.gallery_scaled_cache.clear()
 
     def _start_thumbnail_loader(self, files: list[Path]):
         self._stop_thumbnail_loader()
@@ -775,13 +1061,13 @@ class PreviewPanel(QWidget):
     def _stop_thumbnail_loader(self):
         if self.thumbnail_loader and self.thumbnail_loader.isRunning():
             self.thumbnail_loader.stop()
-            self._stale_loaders.append(self.thumbnail_loader)
+            self._stale_loaders.add(self.thumbnail_loader)
         self.thumbnail_loader = None
 
-    def _on_thumbnail_ready(self, file_path: Path, pixmap: QPixmap):
+    def _on_thumbnail_ready(self, file_path: Path, image: QImage):
         for widget in self.thumbnail_widgets:
             if widget.file_path == file_path:
-                widget.set_pixmap(pixmap)
+                widget.set_pixmap(QPixmap.fromImage(image))
                 break
 
     def wheelEvent(self, event):
@@ -806,25 +1092,23 @@ class PreviewPanel(QWidget):
 
     def resizeEvent(self, event):
         super().resizeEvent(event)
-        if self.live_mode and self.live_image_label.pixmap():
-            current = self.live_image_label.pixmap()
-            if current and not current.isNull():
-                scaled = current.scaled(
-                    self.live_image_label.size(),
-                    Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                    Qt.TransformationMode.SmoothTransformation
-                )
-                self.live_image_label.setPixmap(scaled)
-        if self.current_gallery_pixmap and self.gallery_label.isVisible():
-            scaled = self.current_gallery_pixmap.scaled(
-                self.gallery_label.size(),
-                Qt.AspectRatioMode.KeepAspectRatioByExpanding,
-                Qt.TransformationMode.SmoothTransformation
-            )
-            self.gallery_label.setPixmap(scaled)
+        # Cheap nearest-neighbor frames while the resize is in motion, one
+        # smooth pass once it settles
+        self._rescale_previews(fast=True)
+        self.resize_timer.start()
+
+    def _rescale_previews(self, fast: bool = False):
+        """Rescale displayed previews from their original (unscaled) pixmaps."""
+        if self.live_mode and self._has_live_pixmap:
+            live = self._live_original_pixmap
+            if _scaled_key(live, self.live_image_label, fast) != self._last_live_scaled_key:
+                self._show_live_pixmap(fast)
+        if not fast:
+            self.gallery_scaled_cache.clear()
+        if self._has_gallery_pixmap and self.gallery_label.isVisible():
+            gallery = self.current_gallery_pixmap
+            if _scaled_key(gallery, self.gallery_label, fast) != self._last_gallery_scaled_key:
+                self._show_gallery_pixmap(gallery, fast)
 
     def _cleanup_loader(self, loader):
-        if loader in self._stale_loaders:
-            self._stale_loaders.remove(loader)
-        if loader is self.live_loader:
-            self.live_loader = None
+        self._stale_loaders.discard(loader)
@@ -3,7 +3,6 @@ from PyQt6.QtWidgets import (
     QProgressBar, QGroupBox
 )
 from PyQt6.QtCore import Qt, QTimer
-from collections import deque
 import time
 
 from src.models.conversion_result import ConversionResult
@@ -12,6 +11,11 @@ from src.models.conversion_result import ConversionResult
 class ProgressPanel(QWidget):
     """Panel for displaying conversion progress and statistics."""
 
+    _SUCCESS_TPL = (
+        "<span style='color:{sc};'>Success: {s:,}</span> | "
+        "<span style='color:{fc};'>Failed: {f:,}</span>"
+    )
+
     def __init__(self):
         super().__init__()
         self.start_time = None
@@ -21,17 +25,31 @@ class ProgressPanel(QWidget):
         self.failed = 0
         self.current_file = ""
 
-        # Rolling average for speed calculation (last 10 samples)
-        self.speed_samples = deque(maxlen=10)
+        # Rolling average for speed calculation (ring of the last 10 samples + running sum)
+        self._speed_ring = [0.0] * 10
+        self._speed_idx = 0
+        self._speed_count = 0
+        self._speed_sum = 0.0
+        self.avg_speed = 0.0  # Recomputed only when a sample is pushed
+        self.progress_pct = 0.0
         self.last_update_time = None
         self.last_processed_count = 0
 
+        # Display is only refreshed when progress changed since the last tick
+        self._dirty = False
+        self._batch_active = False  # Results still expected; the update timer may run
+        self._last_percent = -1
+        self._last_processed_counts = None
+        self._last_success_counts = None
+        self._last_current_file = None  # (path, label width) last elided into current_file_label
+
         self.init_ui()
 
-        # Update timer (every 100ms for smooth UI)
+        # Update timer (every 250ms; repaints only when dirty). Runs only while
+        # the panel is shown and a batch is in progress.
         self.update_timer = QTimer()
+        self.update_timer.setInterval(250)
         self.update_timer.timeout.connect(self.update_display)
-        self.update_timer.start(100)
 
     def init_ui(self):
         """Initialize the user interface."""
@@ -101,17 +119,32 @@ class ProgressPanel(QWidget):
 
     def start_batch(self, total_files: int):
         """Start a new batch."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         self.total_files = total_files
         self.processed_files = 0
+        self.progress_pct = 0.0
         self.successful = 0
         self.failed = 0
         self.current_file = ""
-        self.speed_samples.clear()
-        self.last_update_time = time.time()
+        self._reset_speed()
+        self.last_update_time = self.start_time
         self.last_processed_count = 0
+        self._last_percent = -1
+        self._last_processed_counts = None
+        self._last_success_counts = None
 
         self.setVisible(True)
+        self._dirty = True
+        self.update_display()
+        # An empty batch never gets a result, so there is nothing to tick for
+        self._batch_active = total_files > 0
+        if self._batch_active:
+            self.update_timer.start()
+
+    def finish_batch(self):
+        """Render the final state and stop ticking (batch completed or stopped)."""
+        self._batch_active = False
+        self.update_timer.stop()
         self.update_display()
 
     def update_progress(self, result: ConversionResult):
@@ -119,6 +152,7 @@ class ProgressPanel(QWidget):
         self.processed_files += 1
         if self.processed_files > self.total_files:
             self.total_files = self.processed_files
+        self.progress_pct = self.processed_files / self.total_files * 100
 
         if result.success:
             self.successful += 1
@@ -126,45 +160,71 @@ class ProgressPanel(QWidget):
             self.failed += 1
 
         self.current_file = str(result.input_path)
+        self._dirty = True
+        batch_done = self.processed_files >= self.total_files
 
-        # Calculate speed
-        current_time = time.time()
+        # Calculate speed every 0.5 seconds, and always on the last result so
+        # short batches still get one sample
+        current_time = time.monotonic()
         if self.last_update_time:
             elapsed = current_time - self.last_update_time
-            if elapsed >= 0.5:  # Update speed every 0.5 seconds
+            if elapsed >= 0.5 or (batch_done and elapsed > 0):
                 files_processed = self.processed_files - self.last_processed_count
-                if elapsed > 0:
-                    speed = files_processed / elapsed
-                    self.speed_samples.append(speed)
+                speed = files_processed / elapsed
+                self._push_speed(speed)
 
                 self.last_update_time = current_time
                 self.last_processed_count = self.processed_files
 
+        if batch_done:
+            self.finish_batch()
+
+    def showEvent(self, event):
+        """Draw any pending state, and resume display updates when shown mid-batch."""
+        super().showEvent(event)
+        # Results (including the last one) may have arrived while hidden
+        self.update_display()
+        if self._batch_active:
+            self.update_timer.start()
+
+    def hideEvent(self, event):
+        """Stop display updates while hidden."""
+        super().hideEvent(event)
+        self.update_timer.stop()
+
     def update_display(self):
         """Update all display elements."""
-        if not self.isVisible():
+        if not self.isVisible() or not self._dirty:
             return
+        self._dirty = False
 
-        # Progress bar
+        # Progress bar (setFormat repaints even when the value is unchanged)
         if self.total_files > 0:
-            progress = int((self.processed_files / self.total_files) * 100)
-            self.progress_bar.setValue(progress)
-            self.progress_bar.setFormat(f"{progress}%")
+            progress = int(self.progress_pct)
+            if progress != self._last_percent:
+                self._last_percent = progress
+                self.progress_bar.setValue(progress)
+                self.progress_bar.setFormat(f"{progress}%")
 
         # Processed count
-        self.processed_label.setText(f"Processed: {self.processed_files:,} / {self.total_files:,} images")
-
-        # Success/Failure
-        success_color = "#4CAF50" if self.successful > 0 else "#757575"
-        failure_color = "#f44336" if self.failed > 0 else "#757575"
-        self.success_label.setText(
-            f"<span style='color:{success_color};'>Success: {self.successful:,}</span> | "
-            f"<span style='color:{failure_color};'>Failed: {self.failed:,}</span>"
-        )
+        processed_counts = (self.processed_files, self.total_files)
+        if processed_counts != self._last_processed_counts:
+            self._last_processed_counts = processed_counts
+            self.processed_label.setText(f"Processed: {self.processed_files:,} / {self.total_files:,} images")
+
+        # Success/Failure (rich text relayout is costly, so skip it when the counts are unchanged)
+        success_counts = (self.successful, self.failed)
+        if success_counts != self._last_success_counts:
+            self._last_success_counts = success_counts
+            success_color = "#4CAF50" if self.successful > 0 else "#757575"
+            failure_color = "#f44336" if self.failed > 0 else "#757575"
+            self.success_label.setText(self._SUCCESS_TPL.format(
+                sc=success_color, s=self.successful, fc=failure_color, f=self.failed
+            ))
 
         # Speed
-        if self.speed_samples:
-            avg_speed = sum(self.speed_samples) / len(self.speed_samples)
+        if self._speed_count:
+            avg_speed = self.avg_speed
             self.speed_label.setText(f"Speed: {avg_speed:.1f} images/sec")
 
             # ETA
@@ -179,15 +239,34 @@ class ProgressPanel(QWidget):
             self.speed_label.setText("Speed: Calculating...")
             self.eta_label.setText("Time Remaining: Calculating...")
 
-        # Current file
-        if self.current_file:
-            # Truncate long file paths
-            display_name = self.current_file
-            if len(display_name) > 90:
-                display_name = "..." + display_name[-87:]
-            self.current_file_label.setText(display_name)
-        else:
-            self.current_file_label.setText("--")
+        # Current file (elide only when the file or the label width changed)
+        current_file = (self.current_file, self.current_file_label.width())
+        if current_file != self._last_current_file:
+            self._last_current_file = current_file
+            if self.current_file:
+                # Keep the end of long paths, where the file name is
+                metrics = self.current_file_label.fontMetrics()
+                display_name = metrics.elidedText(
+                    self.current_file, Qt.TextElideMode.ElideLeft, self.current_file_label.width()
+                )
+                self.current_file_label.setText(display_name)
+            else:
+                self.current_file_label.setText("--")
+
+    def _push_speed(self, speed: float):
+        """Add a speed sample, evicting the oldest once the ring is full (O(1))."""
+        self._speed_sum += speed - self._speed_ring[self._speed_idx]
+        self._speed_ring[self._speed_idx] = speed
+        self._speed_idx = (self._speed_idx + 1) % len(self._speed_ring)
+        self._speed_count = min(self._speed_count + 1, len(self._speed_ring))
+        self.avg_speed = self._speed_sum / self._speed_count
+
+    def _reset_speed(self):
+        self._speed_ring = [0.0] * len(self._speed_ring)
+        self._speed_idx = 0
+        self._speed_count = 0
+        self._speed_sum = 0.0
+        self.avg_speed = 0.0
 
     @staticmethod
     def format_time(seconds: float) -> str:
@@ -208,29 +287,35 @@ class ProgressPanel(QWidget):
         self.start_time = None
         self.total_files = 0
         self.processed_files = 0
+        self.progress_pct = 0.0
         self.successful = 0
         self.failed = 0
         self.current_file = ""
-        self.speed_samples.clear()
+        self._reset_speed()
+        self._dirty = False
+        self._batch_active = False
+        self._last_percent = -1
+        self._last_processed_counts = None
+        self._last_success_counts = None
+        self._last_current_file = None
+        self.update_timer.stop()
         self.progress_bar.setValue(0)
         self.setVisible(False)
 
     def get_elapsed_time(self) -> float:
         """Get elapsed time since batch started."""
         if self.start_time:
-            return time.time() - self.start_time
+            return time.monotonic() - self.start_time
         return 0.0
 
     def get_stats(self) -> dict:
         """Get current statistics."""
-        avg_speed = sum(self.speed_samples) / len(self.speed_samples) if self.speed_samples else 0
-
         return {
             'total_files': self.total_files,
             'processed': self.processed_files,
             'successful': self.successful,
             'failed': self.failed,
-            'progress_pct': (self.processed_files / self.total_files * 100) if self.total_files > 0 else 0,
-            'speed_per_sec': avg_speed,
+            'progress_pct': self.progress_pct,
+            'speed_per_sec': self.avg_speed,
             'elapsed_time': self.get_elapsed_time()
         }
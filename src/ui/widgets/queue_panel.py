@@ -2,12 +2,36 @@ from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel,
     QListWidget, QListWidgetItem, QPushButton, QGroupBox, QSizePolicy
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QSize
 from PyQt6.QtGui import QColor, QPixmap
 from pathlib import Path
 
 from src.core.batch_manager import BatchJob, BatchStatus
 
+ICON_DIR = Path(__file__).resolve().parent.parent.parent.parent / "resources" / "icons"
+
+# Status -> (icon file, fallback text, fallback color)
+STATUS_ICONS = {
+    BatchStatus.PROCESSING: ("run.png", "Running", "#00E676"),
+    BatchStatus.COMPLETED: ("done.png", "Done", "#00B8D4"),
+    BatchStatus.FAILED: ("fail.png", "Failed", "#FF5252"),
+}
+
+_status_pixmaps = {}  # BatchStatus -> pre-scaled QPixmap (None if the icon file is missing)
+
+
+def _get_status_pixmap(status: BatchStatus):
+    """Load and scale a status icon once; later calls reuse the cached pixmap."""
+    if status not in _status_pixmaps:
+        icon_path = ICON_DIR / STATUS_ICONS[status][0]
+        pixmap = None
+        if icon_path.exists():
+            pixmap = QPixmap(str(icon_path)).scaled(
+                80, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation
+            )
+        _status_pixmaps[status] = pixmap
+    return _status_pixmaps[status]
+
 
 class QueueItemWidget(QWidget):
     """Widget for displaying a single queue item."""
@@ -17,6 +41,8 @@ class QueueItemWidget(QWidget):
     def __init__(self, job: BatchJob):
         super().__init__()
         self.job = job
+        self._last_status = None
+        self._last_details = ""
         self.init_ui()
 
     def init_ui(self):
@@ -31,6 +57,7 @@ class QueueItemWidget(QWidget):
         self.status_label.setFixedSize(80, 24)
         self.status_label.setScaledContents(False)
         self.update_status_icon()
+        self._last_status = self.job.status
         layout.addWidget(self.status_label)
 
         # Job info
@@ -45,7 +72,8 @@ class QueueItemWidget(QWidget):
         info_layout.addWidget(name_label)
 
         # Details
-        self.details_label = QLabel(self.get_details_text())
+        self._last_details = self.get_details_text()
+        self.details_label = QLabel(self._last_details)
         self.details_label.setStyleSheet("color: gray; font-size: 9pt;")
         info_layout.addWidget(self.details_label)
 
@@ -60,40 +88,21 @@ class QueueItemWidget(QWidget):
 
     def update_status_icon(self):
         """Update status icon based on current job status."""
-        icon_base_path = Path(__file__).parent.parent.parent.parent / "resources" / "icons"
-
-        if self.job.status == BatchStatus.QUEUED:
+        status = self.job.status
+        if status == BatchStatus.QUEUED:
             # No icon for queued, just text
             self.status_label.setText("Queued")
             self.status_label.setStyleSheet("color: #00B8D4; font-weight: bold;")
             self.status_label.setPixmap(QPixmap())
-        elif self.job.status == BatchStatus.PROCESSING:
-            icon_path = icon_base_path / "run.png"
-            if icon_path.exists():
-                pixmap = QPixmap(str(icon_path))
-                self.status_label.setPixmap(pixmap.scaled(80, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                self.status_label.setText("")
-            else:
-                self.status_label.setText("Running")
-                self.status_label.setStyleSheet("color: #00E676; font-weight: bold;")
-        elif self.job.status == BatchStatus.COMPLETED:
-            icon_path = icon_base_path / "done.png"
-            if icon_path.exists():
-                pixmap = QPixmap(str(icon_path))
-                self.status_label.setPixmap(pixmap.scaled(80, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
+        elif status in STATUS_ICONS:
+            pixmap = _get_status_pixmap(status)
+            if pixmap is not None:
+                self.status_label.setPixmap(pixmap)
                 self.status_label.setText("")
             else:
-                self.status_label.setText("Done")
-                self.status_label.setStyleSheet("color: #00B8D4; font-weight: bold;")
-        elif self.job.status == BatchStatus.FAILED:
-            icon_path = icon_base_path / "fail.png"
-            if icon_path.exists():
-                pixmap = QPixmap(str(icon_path))
-                self.status_label.setPixmap(pixmap.scaled(80, 24, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation))
-                self.status_label.setText("")
-            else:
-                self.status_label.setText("Failed")
-                self.status_label.setStyleSheet("color: #FF5252; font-weight: bold;")
+                _, text, color = STATUS_ICONS[status]
+                self.status_label.setText(text)
+                self.status_label.setStyleSheet(f"color: {color}; font-weight: bold;")
         else:
             self.status_label.setText("Unknown")
             self.status_label.setStyleSheet("color: #7DE8A6;")
@@ -113,8 +122,14 @@ class QueueItemWidget(QWidget):
     def update_job(self, job: BatchJob):
         """Update display with new job state."""
         self.job = job
-        self.update_status_icon()
-        self.details_label.setText(self.get_details_text())
+        # setText/setPixmap relayout even when nothing changed; skip no-op progress ticks
+        if job.status != self._last_status:
+            self._last_status = job.status
+            self.update_status_icon()
+        details = self.get_details_text()
+        if details != self._last_details:
+            self._last_details = details
+            self.details_label.setText(details)
 
         # Disable remove button if processing
         if job.status == BatchStatus.PROCESSING:
@@ -128,10 +143,15 @@ class QueuePanel(QWidget):
 
     job_removed = pyqtSignal(str)  # job_id
 
+    ITEM_HEIGHT = 60  # Matches QueueItemWidget's minimum height
+    ITEM_SIZE = QSize(0, ITEM_HEIGHT)  # Shared row hint; the list stretches rows to its width
+
     def __init__(self):
         super().__init__()
+        self._last_target_height = None
         self.job_widgets = {}  # job_id -> QueueItemWidget
         self.list_items = {}   # job_id -> QListWidgetItem
+        self._completed_ids = set()  # job_ids currently shown as completed
         self.init_ui()
 
     def init_ui(self):
@@ -152,6 +172,8 @@ class QueuePanel(QWidget):
         # List widget
         self.list_widget = QListWidget()
         self.list_widget.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Fixed)
+        # Every row has the same height, so Qt can skip per-item size queries
+        self.list_widget.setUniformItemSizes(True)
         group_layout.addWidget(self.list_widget)
 
         # Action buttons
@@ -182,10 +204,7 @@ class QueuePanel(QWidget):
 
         # Create list item
         item = QListWidgetItem(self.list_widget)
-        size = widget.sizeHint()
-        if size.height() < 60:
-            size.setHeight(60)
-        item.setSizeHint(size)
+        item.setSizeHint(self.ITEM_SIZE)
 
         # Add to list
         self.list_widget.addItem(item)
@@ -194,6 +213,7 @@ class QueuePanel(QWidget):
         # Store references
         self.job_widgets[job.id] = widget
         self.list_items[job.id] = item
+        self._track_completed(job)
 
         # Show panel
         self.setVisible(True)
@@ -204,6 +224,7 @@ class QueuePanel(QWidget):
         """Update a job's progress display."""
         if job and job.id in self.job_widgets:
             self.job_widgets[job.id].update_job(job)
+            self._track_completed(job)
 
     def set_job_processing(self, job_id: str):
         """Mark a job as processing."""
@@ -211,6 +232,7 @@ class QueuePanel(QWidget):
             job = self.job_widgets[job_id].job
             job.status = BatchStatus.PROCESSING
             self.job_widgets[job_id].update_job(job)
+            self._completed_ids.discard(job_id)
 
     def set_job_completed(self, job_id: str):
         """Mark a job as completed."""
@@ -218,9 +240,21 @@ class QueuePanel(QWidget):
             job = self.job_widgets[job_id].job
             job.status = BatchStatus.COMPLETED
             self.job_widgets[job_id].update_job(job)
+            self._completed_ids.add(job_id)
+
+    def _track_completed(self, job: BatchJob):
+        """Keep the completed-id index in sync with a job's status."""
+        if job.status == BatchStatus.COMPLETED:
+            self._completed_ids.add(job.id)
+        else:
+            self._completed_ids.discard(job.id)
 
     def remove_job(self, job_id: str):
         """Remove a job from the queue display."""
+        self._remove_job_item(job_id)
+        self.update_list_height()
+
+    def _remove_job_item(self, job_id: str):
         if job_id in self.list_items:
             # Remove from list widget
             item = self.list_items[job_id]
@@ -230,11 +264,11 @@ class QueuePanel(QWidget):
             # Remove from dictionaries
             del self.list_items[job_id]
             del self.job_widgets[job_id]
+            self._completed_ids.discard(job_id)
 
             # Hide panel if empty
             if self.list_widget.count() == 0:
                 self.setVisible(False)
-        self.update_list_height()
 
     def on_remove_clicked(self, job_id: str):
         """Handle remove button click."""
@@ -246,22 +280,20 @@ class QueuePanel(QWidget):
         self.list_widget.clear()
         self.job_widgets.clear()
         self.list_items.clear()
+        self._completed_ids.clear()
         self.setVisible(False)
         self.update_list_height()
         self.adjustSize()
 
     def clear_completed(self):
         """Clear all completed jobs from the queue."""
-        # Find all completed jobs
-        completed_ids = []
-        for job_id, widget in self.job_widgets.items():
-            if widget.job.status == BatchStatus.COMPLETED:
-                completed_ids.append(job_id)
-
-        # Remove them
-        for job_id in completed_ids:
-            self.remove_job(job_id)
-            self.job_removed.emit(job_id)
+        self.list_widget.setUpdatesEnabled(False)
+        try:
+            for job_id in list(self._completed_ids):
+                self._remove_job_item(job_id)
+                self.job_removed.emit(job_id)
+        finally:
+            self.list_widget.setUpdatesEnabled(True)
         self.update_list_height()
 
     def get_job_count(self) -> int:
@@ -272,12 +304,12 @@ class QueuePanel(QWidget):
         """Adjust list height to fit current items."""
         if self.list_widget.count() == 0:
             return
-        item_height = self.list_widget.sizeHintForRow(0)
-        if item_height <= 0:
-            item_height = 60
         visible_rows = min(self.list_widget.count(), 4)
         padding = 12
-        target_height = (item_height * visible_rows) + padding
+        target_height = (self.ITEM_HEIGHT * visible_rows) + padding
+        if target_height == self._last_target_height:
+            return
+        self._last_target_height = target_height
         self.list_widget.setFixedHeight(target_height)
         self.list_widget.updateGeometry()
         self.updateGeometry()
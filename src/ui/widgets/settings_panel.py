@@ -1,11 +1,37 @@
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+    QWidget, QVBoxLayout, QHBoxLayout, QFormLayout, QLabel,
     QSlider, QCheckBox, QGroupBox, QSpinBox, QPushButton, QFileDialog
 )
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtCore import Qt, pyqtSignal, QTimer, QSignalBlocker
+import bisect
+import os
+from pathlib import Path
+from typing import NamedTuple
 
 from src.models.app_settings import AppSettings
 
+# JPG quality bands: _Q_DESC[i] covers qualities below _Q_THRESH[i]
+_Q_THRESH = (50, 70, 85, 95)
+_Q_DESC = (
+    "Low quality - Small file size",
+    "Medium quality - Balanced",
+    "Good quality - Recommended",
+    "High quality - Larger file size",
+    "Maximum quality - Largest file size",
+)
+
+
+class _CheckboxRow(NamedTuple):
+    """Declarative description of one settings checkbox and its optional note."""
+
+    text: str
+    field: str  # AppSettings attribute the checkbox reflects
+    slot: str  # SettingsPanel method connected to `toggled`
+    tooltip: str
+    object_name: str = ""
+    note: str = ""
+    note_name: str = "settings_info"
+
 
 class SettingsPanel(QWidget):
     """Panel for conversion settings."""
@@ -16,25 +42,86 @@ class SettingsPanel(QWidget):
     output_dir_changed = pyqtSignal(object)  # Path or None
     context_menu_toggled = pyqtSignal(bool)
 
+    # Checkbox rows in display order; each becomes self.<name>_checkbox
+    _CHECKBOX_ROWS = {
+        "delete_source": _CheckboxRow(
+            text="Delete source files after successful conversion",
+            field="delete_source_on_success",
+            slot="_on_delete_source",
+            tooltip="Move original HEIC files to Recycle Bin after successful conversion",
+            object_name="delete_source_checkbox",
+            note="\u26a0 Files will be moved to Recycle Bin",
+            note_name="delete_warning",
+        ),
+        "preserve_exif": _CheckboxRow(
+            text="Preserve EXIF metadata",
+            field="preserve_exif",
+            slot="_on_preserve_exif",
+            tooltip="Keep camera/date/location metadata in JPGs",
+            note="Keeps date, location, camera info, etc.",
+        ),
+        "operator_mode": _CheckboxRow(
+            text="\U0001F5A5 Operator Mode",
+            field="operator_mode",
+            slot="on_operator_mode_changed",
+            tooltip="Enable Matrix header and visual effects",
+            object_name="operator_mode_checkbox",
+            note="Matrix rain + extra glow effects",
+        ),
+        "context_menu": _CheckboxRow(
+            text="Enable Explorer right-click for folders",
+            field="enable_context_menu",
+            slot="on_context_menu_changed",
+            tooltip="Add a right-click menu entry for folder conversion",
+        ),
+        "use_custom_output_dir": _CheckboxRow(
+            text="Use custom output directory",
+            field="use_custom_output_dir",
+            slot="_on_use_custom_output_dir_changed",
+            tooltip="Send JPGs to a chosen output folder",
+            object_name="use_custom_output_dir_checkbox",
+        ),
+        # Only relevant when custom output is enabled
+        "preserve_structure": _CheckboxRow(
+            text="Preserve folder structure in output",
+            field="preserve_folder_structure",
+            slot="_on_preserve_structure",
+            tooltip="Keep subfolders when using a custom output folder",
+        ),
+    }
+
     def __init__(self, settings: AppSettings):
         super().__init__()
         self.settings = settings
-        self.custom_output_dir = None
+        self.custom_output_dir = settings.custom_output_dir or None
+        self._output_path_obj = Path(self.custom_output_dir) if self.custom_output_dir else None
+        # Output directory row; built on first use (see _build_output_row)
+        self.output_row = None
+        self.custom_output_info = None
+        self._file_dialog = None  # Reused by select_output_directory
+
+        # Coalesce bursts of changes (e.g. slider drags) into one settings_changed
+        self._emit_timer = QTimer(self)
+        self._emit_timer.setSingleShot(True)
+        self._emit_timer.setInterval(75)
+        self._emit_timer.timeout.connect(self._emit_settings)
+
         self.init_ui()
 
+        # Set up the directory dialog while idle so the first Browse... is quick
+        QTimer.singleShot(1500, self._prewarm_file_dialog)
+
     def init_ui(self):
         """Initialize the user interface."""
         layout = QVBoxLayout(self)
 
         # Create group box
         group_box = QGroupBox("Settings")
-        group_layout = QVBoxLayout()
+        # One label/field grid; checkboxes and info labels span both columns
+        group_layout = QFormLayout()
+        group_layout.setVerticalSpacing(12)
 
         # JPG Quality Slider
-        quality_layout = QVBoxLayout()
-        quality_label = QLabel("JPG Quality:")
-        quality_layout.addWidget(quality_label)
-
         quality_slider_layout = QHBoxLayout()
 
         self.quality_slider = QSlider(Qt.Orientation.Horizontal)
@@ -44,6 +131,7 @@ class SettingsPanel(QWidget):
         self.quality_slider.setTickPosition(QSlider.TickPosition.TicksBelow)
         self.quality_slider.setTickInterval(10)
         self.quality_slider.valueChanged.connect(self.on_quality_changed)
+        self.quality_slider.sliderReleased.connect(self._flush_settings)
         self.quality_slider.setToolTip("Adjust JPG quality (0–100)")
         quality_slider_layout.addWidget(self.quality_slider)
 
@@ -52,124 +140,70 @@ class SettingsPanel(QWidget):
         self.quality_value_label.setAlignment(Qt.AlignmentFlag.AlignRight)
         quality_slider_layout.addWidget(self.quality_value_label)
 
-        quality_layout.addLayout(quality_slider_layout)
+        group_layout.addRow("JPG Quality:", quality_slider_layout)
 
         # Quality indicator
-        self.quality_indicator = QLabel(self.get_quality_description(self.settings.jpg_quality))
-        self.quality_indicator.setStyleSheet("color: gray; font-size: 9pt;")
-        quality_layout.addWidget(self.quality_indicator)
-
-        group_layout.addLayout(quality_layout)
+        self._last_quality_desc = self.get_quality_description(self.settings.jpg_quality)
+        self.quality_indicator = QLabel(self._last_quality_desc)
+        self.quality_indicator.setObjectName("settings_info")
+        group_layout.addRow(self.quality_indicator)
 
-        # Spacer
-        group_layout.addSpacing(15)
+        for name, row in self._CHECKBOX_ROWS.items():
+            setattr(self, f"{name}_checkbox", self._add_checkbox_row(group_layout, row))
+            if name == "delete_source":
+                # Worker threads sit between delete-source and the other toggles
+                self._add_thread_rows(group_layout)
 
-        # Delete source checkbox
-        self.delete_source_checkbox = QCheckBox("Delete source files after successful conversion")
-        self.delete_source_checkbox.setChecked(self.settings.delete_source_on_success)
-        self.delete_source_checkbox.stateChanged.connect(self.on_settings_changed)
-        self.delete_source_checkbox.setStyleSheet("font-weight: bold;")
-        self.delete_source_checkbox.setToolTip("Move original HEIC files to Recycle Bin after successful conversion")
-        group_layout.addWidget(self.delete_source_checkbox)
+        # Output directory selection row goes here once custom output is enabled
+        self._group_layout = group_layout
+        self._output_row_index = group_layout.rowCount()
 
-        # Warning label for delete
-        warning_label = QLabel("\u26a0 Files will be moved to Recycle Bin")
-        warning_label.setStyleSheet("color: #ff9800; font-size: 9pt;")
-        warning_label.setIndent(20)
-        group_layout.addWidget(warning_label)
-
-        # Spacer
-        group_layout.addSpacing(15)
+        group_box.setLayout(group_layout)
+        layout.addWidget(group_box)
 
-        # Thread count
-        thread_layout = QHBoxLayout()
-        thread_label = QLabel("Worker Threads:")
-        thread_layout.addWidget(thread_label)
+        # Initialize output row visibility/state
+        self._set_output_row_visible(self.settings.use_custom_output_dir)
+        self.preserve_structure_checkbox.setEnabled(self.settings.use_custom_output_dir)
 
+    def _add_thread_rows(self, layout: QFormLayout):
+        """Add the worker thread count spinbox and its info label."""
         self.thread_spinbox = QSpinBox()
         self.thread_spinbox.setMinimum(1)
         self.thread_spinbox.setMaximum(64)
         self.thread_spinbox.setValue(self.settings.max_workers)
-        self.thread_spinbox.valueChanged.connect(self.on_settings_changed)
+        self.thread_spinbox.valueChanged.connect(self._on_max_workers)
         self.thread_spinbox.setToolTip("Number of worker threads for conversion")
-        thread_layout.addWidget(self.thread_spinbox)
-
-        thread_layout.addStretch()
-        group_layout.addLayout(thread_layout)
+        layout.addRow("Worker Threads:", self.thread_spinbox)
 
         # Thread info
         thread_info = QLabel("Higher values = faster for large datasets")
-        thread_info.setStyleSheet("color: gray; font-size: 9pt;")
-        group_layout.addWidget(thread_info)
-
-        # Spacer
-        group_layout.addSpacing(15)
-
-        # Preserve EXIF checkbox
-        self.preserve_exif_checkbox = QCheckBox("Preserve EXIF metadata")
-        self.preserve_exif_checkbox.setChecked(self.settings.preserve_exif)
-        self.preserve_exif_checkbox.stateChanged.connect(self.on_settings_changed)
-        self.preserve_exif_checkbox.setToolTip("Keep camera/date/location metadata in JPGs")
-        group_layout.addWidget(self.preserve_exif_checkbox)
-
-        # EXIF info
-        exif_info = QLabel("Keeps date, location, camera info, etc.")
-        exif_info.setStyleSheet("color: gray; font-size: 9pt;")
-        exif_info.setIndent(20)
-        group_layout.addWidget(exif_info)
-
-        # Spacer
-        group_layout.addSpacing(15)
-
-        # Operator Mode checkbox
-        self.operator_mode_checkbox = QCheckBox("\U0001F5A5 Operator Mode")
-        self.operator_mode_checkbox.setChecked(self.settings.operator_mode)
-        self.operator_mode_checkbox.stateChanged.connect(self.on_operator_mode_changed)
-        self.operator_mode_checkbox.setStyleSheet("font-weight: bold; color: #00E676;")
-        self.operator_mode_checkbox.setToolTip("Enable Matrix header and visual effects")
-        group_layout.addWidget(self.operator_mode_checkbox)
-
-        # Operator Mode info
-        operator_info = QLabel("Matrix rain + extra glow effects")
-        operator_info.setStyleSheet("color: gray; font-size: 9pt;")
-        operator_info.setIndent(20)
-        group_layout.addWidget(operator_info)
-
-        # Spacer
-        group_layout.addSpacing(15)
-
-        # Explorer context menu checkbox
-        self.context_menu_checkbox = QCheckBox("Enable Explorer right-click for folders")
-        self.context_menu_checkbox.setChecked(self.settings.enable_context_menu)
-        self.context_menu_checkbox.stateChanged.connect(self.on_context_menu_changed)
-        self.context_menu_checkbox.setToolTip("Add a right-click menu entry for folder conversion")
-        group_layout.addWidget(self.context_menu_checkbox)
-
-        # Use Custom Output Directory checkbox
-        self.use_custom_output_dir_checkbox = QCheckBox("Use custom output directory")
-        self.use_custom_output_dir_checkbox.setChecked(self.settings.use_custom_output_dir)
-        self.use_custom_output_dir_checkbox.stateChanged.connect(self._on_use_custom_output_dir_changed)
-        self.use_custom_output_dir_checkbox.setStyleSheet("font-weight: bold;")
-        self.use_custom_output_dir_checkbox.setToolTip("Send JPGs to a chosen output folder")
-        group_layout.addWidget(self.use_custom_output_dir_checkbox)
-
-        # Preserve folder structure checkbox (only relevant when custom output is enabled)
-        self.preserve_structure_checkbox = QCheckBox("Preserve folder structure in output")
-        self.preserve_structure_checkbox.setChecked(self.settings.preserve_folder_structure)
-        self.preserve_structure_checkbox.stateChanged.connect(self.on_settings_changed)
-        group_layout.addWidget(self.preserve_structure_checkbox)
-        self.preserve_structure_checkbox.setToolTip("Keep subfolders when using a custom output folder")
-
-        # Output directory selection row (hidden until enabled)
+        thread_info.setObjectName("settings_info")
+        layout.addRow(thread_info)
+
+    def _add_checkbox_row(self, layout: QFormLayout, row: _CheckboxRow) -> QCheckBox:
+        """Create the checkbox described by row (and its note) as form rows."""
+        checkbox = QCheckBox(row.text)
+        checkbox.setChecked(getattr(self.settings, row.field))
+        checkbox.toggled.connect(getattr(self, row.slot))
+        checkbox.setToolTip(row.tooltip)
+        if row.object_name:
+            checkbox.setObjectName(row.object_name)
+        layout.addRow(checkbox)
+        if row.note:
+            note_label = QLabel(row.note)
+            note_label.setObjectName(row.note_name)
+            note_label.setIndent(20)
+            layout.addRow(note_label)
+        return checkbox
+
+    def _build_output_row(self):
+        """Create the output directory row and its info label (first use only)."""
         self.output_row = QWidget()
         output_layout = QHBoxLayout(self.output_row)
-        output_layout.setContentsMargins(20, 0, 0, 0)
+        output_layout.setContentsMargins(0, 0, 0, 0)
 
-        output_label = QLabel("Output to:")
-        output_layout.addWidget(output_label)
-
-        self.output_path_label = QLabel("(Not selected)")
-        self.output_path_label.setStyleSheet("color: #7DE8A6; font-style: italic;")
+        self.output_path_label = QLabel()
+        self.output_path_label.setObjectName("output_path_label")
         output_layout.addWidget(self.output_path_label, stretch=1)
 
         self.browse_button = QPushButton("Browse...")
@@ -182,50 +216,60 @@ class SettingsPanel(QWidget):
         self.open_button.setToolTip("Open output folder")
         output_layout.addWidget(self.open_button)
 
-        group_layout.addWidget(self.output_row)
+        self._group_layout.insertRow(self._output_row_index, "Output to:", self.output_row)
 
         # Custom Output Directory info
         self.custom_output_info = QLabel("Converted files go to a chosen folder. Disable preserve to flatten into one folder.")
-        self.custom_output_info.setStyleSheet("color: gray; font-size: 9pt;")
+        self.custom_output_info.setObjectName("settings_info")
         self.custom_output_info.setIndent(20)
-        group_layout.addWidget(self.custom_output_info)
-
-        # Add stretch to push everything to top
-        group_layout.addStretch()
+        self._group_layout.insertRow(self._output_row_index + 1, self.custom_output_info)
 
-        group_box.setLayout(group_layout)
-        layout.addWidget(group_box)
+        self._update_output_row()
 
-        # Initialize output row visibility/state
-        self._set_output_row_visible(self.settings.use_custom_output_dir)
-        if self.settings.custom_output_dir:
-            self.custom_output_dir = self.settings.custom_output_dir
-            self.output_path_label.setText(self.settings.custom_output_dir)
-            self.output_path_label.setStyleSheet("color: #00E676; font-weight: bold;")
-        self.preserve_structure_checkbox.setEnabled(self.settings.use_custom_output_dir)
+    def _update_output_row(self):
+        """Show the current output directory in the output row, if it exists."""
+        if self.output_row is None:
+            return
+        self.output_path_label.setText(self.custom_output_dir or "(Not selected)")
+        self.output_path_label.setProperty("selected", bool(self.custom_output_dir))
+        self.output_path_label.style().polish(self.output_path_label)
         self.open_button.setEnabled(bool(self.custom_output_dir))
 
     def get_quality_description(self, quality: int) -> str:
         """Get description for quality level."""
-        if quality < 50:
-            return "Low quality - Small file size"
-        elif quality < 70:
-            return "Medium quality - Balanced"
-        elif quality < 85:
-            return "Good quality - Recommended"
-        elif quality < 95:
-            return "High quality - Larger file size"
-        else:
-            return "Maximum quality - Largest file size"
+        return _Q_DESC[bisect.bisect_right(_Q_THRESH, quality)]
 
     def on_quality_changed(self, value: int):
         """Handle quality slider change."""
         self.quality_value_label.setText(f"{value}%")
-        self.quality_indicator.setText(self.get_quality_description(value))
-        self.on_settings_changed()
+        # Only a handful of bands; skip the relayout while dragging within one
+        description = self.get_quality_description(value)
+        if description != self._last_quality_desc:
+            self._last_quality_desc = description
+            self.quality_indicator.setText(description)
+        self._set_setting("jpg_quality", value)
+
+    def _on_delete_source(self, checked: bool):
+        self._set_setting("delete_source_on_success", checked)
+
+    def _on_max_workers(self, value: int):
+        self._set_setting("max_workers", value)
+
+    def _on_preserve_exif(self, checked: bool):
+        self._set_setting("preserve_exif", checked)
+
+    def _on_preserve_structure(self, checked: bool):
+        self._set_setting("preserve_folder_structure", checked)
+
+    def _set_setting(self, name: str, value):
+        """Update one settings field; schedule settings_changed only if it changed."""
+        if getattr(self.settings, name) == value:
+            return
+        setattr(self.settings, name, value)
+        self._emit_timer.start()
 
     def on_settings_changed(self):
-        """Handle any settings change."""
+        """Copy every control back into the settings object and schedule settings_changed."""
         # Update settings object
         self.settings.jpg_quality = self.quality_slider.value()
         self.settings.delete_source_on_success = self.delete_source_checkbox.isChecked()
@@ -236,75 +280,95 @@ class SettingsPanel(QWidget):
         self.settings.custom_output_dir = self.custom_output_dir or ""
         self.settings.preserve_folder_structure = self.preserve_structure_checkbox.isChecked()
 
-        # Emit signal
+        # Emit signal once the burst settles
+        self._emit_timer.start()
+
+    def _emit_settings(self):
         self.settings_changed.emit(self.settings)
 
-    def on_operator_mode_changed(self):
+    def _flush_settings(self):
+        """Emit a pending settings change right away."""
+        if self._emit_timer.isActive():
+            self._emit_timer.stop()
+            self._emit_settings()
+
+    def on_operator_mode_changed(self, enabled: bool):
         """Handle operator mode change."""
-        self.settings.operator_mode = self.operator_mode_checkbox.isChecked()
-        self.operator_mode_changed.emit(self.settings.operator_mode)
-        self.on_settings_changed()
+        self._set_setting("operator_mode", enabled)
+        self.operator_mode_changed.emit(enabled)
 
-    def on_context_menu_changed(self):
+    def on_context_menu_changed(self, enabled: bool):
         """Handle context menu toggle."""
-        self.settings.enable_context_menu = self.context_menu_checkbox.isChecked()
-        self.context_menu_toggled.emit(self.settings.enable_context_menu)
-        self.on_settings_changed()
+        self._set_setting("enable_context_menu", enabled)
+        self.context_menu_toggled.emit(enabled)
 
-    def _on_use_custom_output_dir_changed(self):
+    def _on_use_custom_output_dir_changed(self, enabled: bool):
         """Handle use custom output directory checkbox change."""
-        self.settings.use_custom_output_dir = self.use_custom_output_dir_checkbox.isChecked()
-        self.custom_output_dir_toggled.emit(self.settings.use_custom_output_dir)
-        self._set_output_row_visible(self.settings.use_custom_output_dir)
-        self.preserve_structure_checkbox.setEnabled(self.settings.use_custom_output_dir)
-        if self.settings.use_custom_output_dir:
+        self._apply_use_custom_output_dir(enabled)
+
+    def _apply_use_custom_output_dir(self, enabled: bool):
+        self._set_setting("use_custom_output_dir", enabled)
+        self.custom_output_dir_toggled.emit(enabled)
+        self._set_output_row_visible(enabled)
+        self.preserve_structure_checkbox.setEnabled(enabled)
+        if enabled:
             # Prompt immediately for output directory
             if not self.custom_output_dir:
                 self.select_output_directory()
         else:
             # Clear output directory when disabled
             self.custom_output_dir = None
-            self.settings.custom_output_dir = ""
-            self.output_path_label.setText("(Not selected)")
-            self.output_path_label.setStyleSheet("color: #7DE8A6; font-style: italic;")
-            self.open_button.setEnabled(False)
+            self._output_path_obj = None
+            self._set_setting("custom_output_dir", "")
+            self._update_output_row()
             self.output_dir_changed.emit(None)
-        self.on_settings_changed()
 
     def _set_output_row_visible(self, visible: bool):
-        self.output_row.setVisible(visible)
-        self.custom_output_info.setVisible(visible)
+        if self.output_row is None:
+            if not visible:
+                return
+            self._build_output_row()
+        # setRowVisible also hides the "Output to:" label and the row spacing
+        self._group_layout.setRowVisible(self.output_row, visible)
+        self._group_layout.setRowVisible(self.custom_output_info, visible)
+
+    def _prewarm_file_dialog(self):
+        if self._file_dialog is None:
+            self._file_dialog = QFileDialog(self, "Select Output Directory")
+            self._file_dialog.setFileMode(QFileDialog.FileMode.Directory)
+            self._file_dialog.setOptions(
+                QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
+            )
 
     def select_output_directory(self):
         """Open dialog to select output directory."""
-        directory = QFileDialog.getExistingDirectory(
-            self,
-            "Select Output Directory",
-            "",
-            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontResolveSymlinks
-        )
+        self._prewarm_file_dialog()
+        directory = ""
+        if self._file_dialog.exec():
+            selected = self._file_dialog.selectedFiles()
+            if selected:
+                directory = selected[0]
 
         if directory:
             self.custom_output_dir = directory
-            self.settings.custom_output_dir = directory
-            self.output_path_label.setText(directory)
-            self.output_path_label.setStyleSheet("color: #00E676; font-weight: bold;")
-            self.open_button.setEnabled(True)
+            self._output_path_obj = Path(directory)
+            self._set_setting("custom_output_dir", directory)
+            self._update_output_row()
             self.output_dir_changed.emit(directory)
-            self.on_settings_changed()
         else:
             # If user cancels and no prior selection, disable custom output
             if not self.custom_output_dir:
-                self.use_custom_output_dir_checkbox.setChecked(False)
+                # Apply the state directly rather than re-entering the checkbox slot
+                with QSignalBlocker(self.use_custom_output_dir_checkbox):
+                    self.use_custom_output_dir_checkbox.setChecked(False)
+                self._apply_use_custom_output_dir(False)
 
     def open_output_directory(self):
         """Open the selected output directory."""
-        if not self.custom_output_dir:
+        output_dir = self._output_path_obj
+        if output_dir is None:
             return
         try:
-            import os
-            from pathlib import Path
-            output_dir = Path(self.custom_output_dir)
             if output_dir.exists() and os.name == 'nt':
                 os.startfile(output_dir)
         except Exception:
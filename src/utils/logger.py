@@ -1,14 +1,32 @@
+import atexit
+import json
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # Optional; falls back to the stdlib json module
+    orjson = None
+
+DEFAULT_LOG_DIR = Path(__file__).parent.parent.parent / "logs"
+
+# The log format doesn't use thread/process fields; skip collecting them per record
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+logging.logAsyncioTasks = False  # Python 3.12+; harmless on older versions
+
 
 class LoggerSetup:
     """Configure application logging."""
 
     _initialized = False
+    log_dir = None  # Resolved log directory, set once by setup()
+    _listener = None  # Drains queued records into the file handlers
 
     @classmethod
     def setup(cls, log_dir: Path = None, log_level: str = "INFO") -> None:
@@ -23,9 +41,10 @@ class LoggerSetup:
             return
 
         if log_dir is None:
-            log_dir = Path(__file__).parent.parent.parent / "logs"
+            log_dir = DEFAULT_LOG_DIR
 
         log_dir.mkdir(parents=True, exist_ok=True)
+        cls.log_dir = log_dir
 
         # Configure root logger
         logger = logging.getLogger()
@@ -56,7 +75,6 @@ class LoggerSetup:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
 
         # Conversion errors log (failures only, rotating)
         error_log_path = log_dir / "conversion_errors.log"
@@ -68,7 +86,14 @@ class LoggerSetup:
         )
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
+
+        # File I/O happens on a listener thread; callers (conversion workers)
+        # only enqueue records
+        log_queue = queue.Queue(-1)
+        logger.addHandler(QueueHandler(log_queue))
+        cls._listener = QueueListener(log_queue, file_handler, error_handler, respect_handler_level=True)
+        cls._listener.start()
+        atexit.register(cls._listener.stop)
 
         cls._initialized = True
 
@@ -101,22 +126,27 @@ def create_session_log(log_dir: Path, batch_id: str, results: list) -> Path:
     Returns:
         Path to the created log file
     """
-    import json
-
     timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
     log_path = log_dir / f"session_{batch_id}_{timestamp}.json"
 
-    # Summary statistics
-    total = len(results)
-    successes = sum(1 for r in results if r.success)
-    failures = total - successes
-
-    total_size_before = sum(r.file_size_before or 0 for r in results if r.success)
-    total_size_after = sum(r.file_size_after or 0 for r in results if r.success)
+    # Summary statistics (one pass over results)
+    successes = failures = 0
+    total_size_before = total_size_after = 0
+    total_time = 0.0
+    result_dicts = []
+    for r in results:
+        result_dicts.append(r.to_dict())
+        if r.success:
+            successes += 1
+            total_size_before += r.file_size_before or 0
+            total_size_after += r.file_size_after or 0
+        else:
+            failures += 1
+        if r.conversion_time:
+            total_time += r.conversion_time
+    total = successes + failures
     total_saved = total_size_before - total_size_after
 
-    total_time = sum(r.conversion_time or 0 for r in results if r.conversion_time)
-
     session_data = {
         'batch_id': batch_id,
         'timestamp': timestamp,
@@ -131,10 +161,14 @@ def create_session_log(log_dir: Path, batch_id: str, results: list) -> Path:
             'total_time_seconds': f"{total_time:.2f}",
             'avg_time_per_file_ms': f"{(total_time / total * 1000):.2f}" if total > 0 else "0"
         },
-        'results': [r.to_dict() for r in results]
+        'results': result_dicts
     }
 
-    with open(log_path, 'w', encoding='utf-8') as f:
-        json.dump(session_data, f, indent=2, ensure_ascii=False)
+    # Serialize into one buffer and write it with a single call
+    if orjson is not None:
+        payload = orjson.dumps(session_data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(session_data, indent=2, ensure_ascii=False).encode('utf-8')
+    log_path.write_bytes(payload)
 
     return log_path
@@ -9,22 +9,38 @@ except ImportError:  # Non-Windows
 
 APP_KEY = r"Software\Classes\Directory\shell\HEICtoJPG"
 
+# Platform support cannot change at runtime; evaluate it once at import
+_SUPPORTED = os.name == "nt" and winreg is not None
+
+# Last known registration state; None means "ask the registry"
+_enabled_cache = None
+
 
 def is_supported() -> bool:
-    return os.name == "nt" and winreg is not None
+    return _SUPPORTED
 
 
 def is_enabled() -> bool:
+    global _enabled_cache
     if not is_supported():
         return False
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, APP_KEY) as _:
-            return True
-    except OSError:
-        return False
+    if _enabled_cache is None:
+        try:
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, APP_KEY) as _:
+                _enabled_cache = True
+        except OSError:
+            _enabled_cache = False
+    return _enabled_cache
+
+
+def invalidate_cache() -> None:
+    """Forget the cached state, e.g. after the registry was changed externally."""
+    global _enabled_cache
+    _enabled_cache = None
 
 
 def enable(exe_path: Path) -> None:
+    global _enabled_cache
     if not is_supported():
         return
     exe_path = Path(exe_path).resolve()
@@ -34,15 +50,22 @@ def enable(exe_path: Path) -> None:
         winreg.SetValueEx(key, "Icon", 0, winreg.REG_SZ, str(exe_path))
         with winreg.CreateKey(key, "command") as cmd_key:
             winreg.SetValueEx(cmd_key, "", 0, winreg.REG_SZ, command)
+    _enabled_cache = True
 
 
 def disable() -> None:
+    global _enabled_cache
     if not is_supported():
         return
-    try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER, APP_KEY + r"\command"):
+    # Subkey first (DeleteKey cannot remove a key that has subkeys). Each delete
+    # is attempted on its own so a missing command key still removes APP_KEY.
+    removed = True
+    for key in (APP_KEY + r"\command", APP_KEY):
+        try:
+            winreg.DeleteKey(winreg.HKEY_CURRENT_USER, key)
+        except FileNotFoundError:
             pass
-        winreg.DeleteKey(winreg.HKEY_CURRENT_USER, APP_KEY + r"\command")
-        winreg.DeleteKey(winreg.HKEY_CURRENT_USER, APP_KEY)
-    except OSError:
-        pass
+        except OSError:
+            removed = False
+    # If a delete failed for another reason, let the next is_enabled() re-check
+    _enabled_cache = False if removed else None